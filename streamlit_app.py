@@ -12,7 +12,7 @@ encoding of FNC1 and group separator characters.
 Requirements:
 - streamlit
 - reportlab
-- PyPDF2
+- pikepdf
 - treepoem
 - Pillow
 - python-dateutil
@@ -22,26 +22,89 @@ Ghostscript must be installed on the system for treepoem to function correctly.
 
 from __future__ import annotations
 
-import re
+import functools
+import hashlib
+import itertools
+import os
+import select
+import shutil
+import string
+import subprocess
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
+from types import ModuleType
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 import streamlit as st
-from PyPDF2 import PdfReader, PdfWriter
 from reportlab.lib.units import mm
-from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfgen import canvas
 from streamlit_pdf_viewer import pdf_viewer
 
-try:
-    import treepoem  # type: ignore[import]
-except ImportError as exc:  # pragma: no cover
-    raise RuntimeError(
-        "The 'treepoem' package is required to generate GS1 DataMatrix barcodes. "
-        "Please add treepoem to your requirements and ensure Ghostscript is installed."
-    ) from exc
+if TYPE_CHECKING:
+    import pikepdf
+
+
+@functools.lru_cache(maxsize=None)
+def _treepoem() -> ModuleType:
+    """
+    Import treepoem on first use, so the form renders without waiting for it.
+    """
+    try:
+        import treepoem  # type: ignore[import]
+    except ImportError as exc:  # pragma: no cover
+        raise RuntimeError(
+            "The 'treepoem' package is required to generate GS1 DataMatrix barcodes. "
+            "Please add treepoem to your requirements and ensure Ghostscript is installed."
+        ) from exc
+    return treepoem
+
+
+# Load Helvetica's metrics at import so the first label render does not pay for it
+pdfmetrics.getFont("Helvetica")
+
+# Directory containing this script, used to locate the bundled template
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Map country names to GS1 numeric codes
+COUNTRY_OPTIONS = {
+    "United States": "840",
+    "Japan": "392",
+    "China": "156",
+}
+
+
+class _KeepOnly(dict):
+    """
+    ``str.translate`` table that keeps the given characters and deletes all others.
+    """
+
+    def __init__(self, allowed: str) -> None:
+        super().__init__((ord(ch), ord(ch)) for ch in allowed)
+        self.allowed = frozenset(allowed)
+
+    def apply(self, text: str) -> str:
+        """
+        Uppercase ``text`` and delete disallowed characters.
+
+        Text that is already valid, the usual case, is returned as-is without
+        allocating uppercased or translated copies.
+        """
+        if self.allowed.issuperset(text):
+            return text
+        return text.upper().translate(self)
+
+    def __missing__(self, key: int) -> None:
+        return None
+
+
+# Characters accepted by this app for GS1 AI 10/91, and for text fields (which also allow spaces)
+_LOT_TABLE = _KeepOnly(string.ascii_uppercase + string.digits + "-./")
+_GS1_TABLE = _KeepOnly(string.ascii_uppercase + string.digits + "-./ ")
 
 
 def sanitize_lot_code(lot_code: str) -> str:
@@ -60,7 +123,7 @@ def sanitize_lot_code(lot_code: str) -> str:
     str
         Sanitized lot code containing only valid characters.
     """
-    return re.sub(r'[^A-Z0-9\-\.\/]', '', lot_code.upper())
+    return _LOT_TABLE.apply(lot_code)
 
 
 def sanitize_gs1_text(text: str) -> str:
@@ -80,7 +143,7 @@ def sanitize_gs1_text(text: str) -> str:
     str
         Sanitized text suitable for GS1 encoding.
     """
-    return re.sub(r'[^A-Z0-9\-\.\/ ]', '', text.upper())
+    return _GS1_TABLE.apply(text)
 
 
 def sanitize_ai91_text(text: str) -> str:
@@ -100,7 +163,7 @@ def sanitize_ai91_text(text: str) -> str:
     str
         Sanitized and truncated text suitable for GS1 AI 91.
     """
-    sanitized = re.sub(r'[^A-Z0-9\-\.\/]', '', text.upper())
+    sanitized = _LOT_TABLE.apply(text)
     return sanitized[:40]
 
 
@@ -149,7 +212,8 @@ def build_gs1_string(
     str
         Concatenated GS1 data string ready for barcode encoding.
     """
-    mfg_str = mfg.strftime("%y%m%d")
+    # Integer formatting is about twice as fast as strftime("%y%m%d")
+    mfg_str = f"{mfg.year % 100:02d}{mfg.month:02d}{mfg.day:02d}"
     sku_sanitized = sanitize_gs1_text(sku)
     cust_po_sanitized = sanitize_gs1_text(cust_po)
     cust_part_sanitized = sanitize_gs1_text(cust_part)
@@ -169,12 +233,277 @@ def build_gs1_string(
     )
 
 
-def generate_barcode_image(gs1_data: str) -> "PIL.Image.Image":
+def _has_finder_pattern(rows: Tuple[str, ...]) -> bool:
+    """
+    Check a module grid for the solid L-shaped DataMatrix finder pattern.
+
+    Every DataMatrix symbol has an all-dark left column and bottom row.
+
+    Parameters
+    ----------
+    rows : Tuple[str, ...]
+        Module grid, top to bottom, with "1" for dark modules.
+
+    Returns
+    -------
+    bool
+        True if the left column and bottom row are all dark.
+    """
+    return set(rows[-1]) == {"1"} and all(row[0] == "1" for row in rows)
+
+
+def _image_to_modules(image: "PIL.Image.Image") -> Tuple[str, ...]:
     """
-    Generate a GS1 DataMatrix barcode as a PIL Image.
+    Recover the module grid of a DataMatrix symbol from its cropped raster image.
 
-    Uses the treepoem library to render the barcode with correct GS1 formatting,
-    automatically inserting FNC1 and group separator characters.
+    The top row and right column of every DataMatrix symbol are clock tracks that
+    alternate dark and light one module at a time, so the number of runs along
+    them gives the column and row counts. Each module is then sampled at its centre.
+
+    Parameters
+    ----------
+    image : PIL.Image.Image
+        The barcode image, cropped to the symbol without a quiet zone.
+
+    Returns
+    -------
+    Tuple[str, ...]
+        One string per symbol row, top to bottom, with "1" for dark modules and
+        "0" for light ones.
+
+    Raises
+    ------
+    RuntimeError
+        If the image does not yield a plausible square DataMatrix grid, rather than
+        risk printing a well-formed but wrong symbol.
+    """
+    width, height = image.size
+    # One byte per pixel, row-major; read directly instead of through PIL pixel access
+    pixels = image.convert("L").tobytes()
+
+    def dark(x: int, y: int) -> bool:
+        return pixels[y * width + x] < 128
+
+    cols = sum(1 for _ in itertools.groupby(dark(x, 0) for x in range(width)))
+    rows = sum(1 for _ in itertools.groupby(dark(width - 1, y) for y in range(height)))
+    # Square ECC200 symbols have an even number of rows and columns, at least 10 each,
+    # and every module must cover a whole number of pixels
+    if (
+        rows % 2
+        or cols % 2
+        or rows < 10
+        or cols < 10
+        or width % cols
+        or height % rows
+    ):
+        raise RuntimeError(
+            f"Cannot recover a DataMatrix grid from a {width}x{height} barcode image "
+            f"({cols} columns, {rows} rows)."
+        )
+    modules = tuple(
+        "".join(
+            "1" if dark(int((i + 0.5) * width / cols), int((j + 0.5) * height / rows)) else "0"
+            for i in range(cols)
+        )
+        for j in range(rows)
+    )
+    if not _has_finder_pattern(modules):
+        raise RuntimeError("Barcode image is missing the DataMatrix finder pattern.")
+    return modules
+
+
+# Encodes one symbol with BWIPP's "dontdraw" option and prints "<columns> <modules>"
+# (or a BWIPP error) followed by an end-of-job marker line
+_BWIPP_JOB = """\
+clear
+{{
+  <{data}> <{options}> <{barcode_type}> cvn /uk.co.terryburton.bwipp findresource exec
+  dup /pixx get =only ( ) print /pixs get {{ =only }} forall
+}} stopped {{
+  (BWIPP ERROR: ) print $error /errorname get =only ( ) print $error /errorinfo get =only
+  $error /newerror false put
+  % BWIPP raises errors with stop from inside its encoders' local dictionaries
+  cleardictstack
+}} if
+(\\n{marker}\\n) print flush
+clear
+"""
+_BWIPP_END_MARKER = "%%END-OF-BARCODE%%"
+
+# Seconds to wait for the interpreter to answer a job before restarting it
+_GHOSTSCRIPT_TIMEOUT = 10.0
+
+
+class _GhostscriptSessionError(RuntimeError):
+    """
+    Raised when the persistent Ghostscript interpreter exits or replies unexpectedly.
+    """
+
+
+class _GhostscriptSession:
+    """
+    A long-lived Ghostscript interpreter with the BWIPP library preloaded.
+
+    Barcode jobs are written to the interpreter's stdin and the module grid is read
+    back from its stdout, so process start-up and parsing BWIPP's PostScript are paid
+    once per process rather than once per barcode.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._pid = os.getpid()
+
+    def _start(self) -> subprocess.Popen:
+        binary = shutil.which("gs")
+        if binary is None:
+            raise _GhostscriptSessionError("Ghostscript executable 'gs' not found.")
+        # load_bwipp is not part of treepoem's documented API, so treat its absence like
+        # any other session failure and let the caller fall back to treepoem itself
+        load_bwipp = getattr(_treepoem(), "load_bwipp", None)
+        if load_bwipp is None:
+            raise _GhostscriptSessionError("treepoem does not expose its BWIPP prologue.")
+        try:
+            prologue = load_bwipp()
+        except OSError as exc:
+            raise _GhostscriptSessionError("Could not read treepoem's BWIPP prologue.") from exc
+        process = subprocess.Popen(
+            [binary, "-q", "-dSAFER", "-dNODISPLAY", "-dNOPAUSE", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            self._write(process.stdin, prologue)
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        return process
+
+    @staticmethod
+    def _write(stream: IO[bytes], code: str) -> None:
+        try:
+            stream.write(code.encode())
+            stream.flush()
+        except OSError as exc:
+            raise _GhostscriptSessionError("Ghostscript stopped accepting input.") from exc
+
+    def close(self) -> None:
+        """
+        Stop the interpreter; the next job starts a fresh one.
+        """
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+
+    def encode(self, barcode_type: str, data: str, options: str) -> Tuple[str, ...]:
+        """
+        Encode a matrix barcode and return its module grid.
+
+        Parameters
+        ----------
+        barcode_type : str
+            BWIPP encoder name, e.g. "gs1datamatrix".
+        data : str
+            Data to encode.
+        options : str
+            BWIPP options string; "dontdraw" is appended automatically.
+
+        Returns
+        -------
+        Tuple[str, ...]
+            One string per symbol row, top to bottom, with "1" for dark modules and
+            "0" for light ones.
+        """
+        job = _BWIPP_JOB.format(
+            data=data.encode().hex(),
+            options=f"{options} dontdraw".encode().hex(),
+            barcode_type=barcode_type.encode().hex(),
+            marker=_BWIPP_END_MARKER,
+        )
+        if self._pid != os.getpid():
+            # Inherited through fork: the interpreter and lock belong to the parent process
+            self._lock = threading.Lock()
+            self._process = None
+            self._pid = os.getpid()
+        with self._lock:
+            if self._process is None or self._process.poll() is not None:
+                self._process = self._start()
+            try:
+                self._write(self._process.stdin, job)
+                return self._parse_reply(self._read_reply())
+            except _GhostscriptSessionError:
+                # The interpreter may be stuck or in an unknown state; start afresh next time
+                self.close()
+                raise
+
+    def _read_reply(self) -> str:
+        """
+        Read one job's reply, up to the end marker, within the timeout.
+
+        Reads the pipe directly rather than through the buffered file object, so that
+        ``select`` sees exactly the data that has not been consumed yet.
+        """
+        stdout = self._process.stdout.fileno()
+        end = f"\n{_BWIPP_END_MARKER}\n".encode()
+        deadline = time.monotonic() + _GHOSTSCRIPT_TIMEOUT
+        reply = b""
+        while not reply.endswith(end):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([stdout], [], [], remaining)[0]:
+                raise _GhostscriptSessionError("Ghostscript did not answer in time.")
+            chunk = os.read(stdout, 65536)
+            if not chunk:
+                raise _GhostscriptSessionError("Ghostscript exited unexpectedly.")
+            reply += chunk
+        return " ".join(reply[:-len(end)].decode().split())
+
+    @staticmethod
+    def _parse_reply(result: str) -> Tuple[str, ...]:
+        """
+        Turn a job's reply into a module grid, raising BWIPP errors as TreepoemError.
+        """
+        if result.startswith("BWIPP ERROR: bwipp."):
+            raise _treepoem().TreepoemError(result[len("BWIPP ERROR: "):])
+        try:
+            cols_text, bits = result.split(" ", 1)
+            cols = int(cols_text)
+        except ValueError:
+            raise _GhostscriptSessionError(f"Unexpected Ghostscript reply: {result!r}") from None
+        if cols <= 0 or len(bits) % cols or set(bits) - {"0", "1"}:
+            raise _GhostscriptSessionError(f"Unexpected Ghostscript reply: {result!r}")
+        rows = tuple(bits[i:i + cols] for i in range(0, len(bits), cols))
+        # The solid finder edge runs along the bottom of a DataMatrix symbol; flip the
+        # grid if BWIPP listed the rows bottom to top
+        if set(rows[-1]) != {"1"} and set(rows[0]) == {"1"}:
+            rows = rows[::-1]
+        if not _has_finder_pattern(rows):
+            raise _GhostscriptSessionError(f"Unexpected Ghostscript reply: {result!r}")
+        return rows
+
+
+@st.cache_resource(show_spinner=False)
+def _ghostscript_session() -> _GhostscriptSession:
+    """
+    Return the Ghostscript interpreter shared by all sessions in this process.
+    """
+    return _GhostscriptSession()
+
+
+@st.cache_resource(show_spinner=False, max_entries=128)
+def generate_barcode_modules(gs1_data: str) -> Tuple[str, ...]:
+    """
+    Generate a GS1 DataMatrix barcode as a grid of modules.
+
+    Encodes the data with BWIPP (bundled with treepoem) in a persistent Ghostscript
+    interpreter, which inserts the FNC1 and group separator characters required by GS1.
+    The module grid is drawn as vector shapes instead of being embedded as an image.
+    If the persistent interpreter is unavailable, falls back to rendering the barcode
+    with treepoem and recovering the grid from the image. Up to 128 results are cached
+    with Streamlit, so they survive script reruns and are shared between sessions;
+    repeated GS1 payloads are not encoded again.
 
     Parameters
     ----------
@@ -183,36 +512,154 @@ def generate_barcode_image(gs1_data: str) -> "PIL.Image.Image":
 
     Returns
     -------
-    PIL.Image.Image
-        The generated barcode image in RGB mode.
+    Tuple[str, ...]
+        One string per symbol row, top to bottom, with "1" for dark modules and
+        "0" for light ones.
     """
-    barcode = treepoem.generate_barcode(
-        barcode_type="gs1datamatrix",
-        data=gs1_data,
-        options={"parsefnc": True},
-    )
-    return barcode.convert("RGB")
+    return _encode_barcode(gs1_data, _ghostscript_session())
 
 
-@st.cache_data(show_spinner=False)
-def render_label(
+def _encode_barcode(gs1_data: str, session: _GhostscriptSession) -> Tuple[str, ...]:
+    """
+    Encode a GS1 DataMatrix barcode with the given interpreter, without any caching.
+
+    Falls back to treepoem when the interpreter is unavailable.
+    """
+    try:
+        modules = session.encode("gs1datamatrix", gs1_data, "parsefnc")
+    except _GhostscriptSessionError:
+        barcode = _treepoem().generate_barcode(
+            barcode_type="gs1datamatrix",
+            data=gs1_data,
+            options={"parsefnc": True},
+        )
+        modules = _image_to_modules(barcode)
+    return modules
+
+
+def draw_barcode(
+    c: canvas.Canvas,
+    modules: Tuple[str, ...],
+    x: float,
+    y: float,
+    width: float,
+    height: float,
+) -> None:
+    """
+    Draw a DataMatrix module grid onto a ReportLab canvas as filled vector paths.
+
+    Horizontal runs of dark modules are merged into a single rectangle, and the
+    whole symbol is emitted as one path.
+
+    Parameters
+    ----------
+    c : canvas.Canvas
+        The canvas to draw on.
+    modules : Tuple[str, ...]
+        Module grid as returned by :func:`generate_barcode_modules`.
+    x, y : float
+        Position of the bottom-left corner of the symbol, in points.
+    width, height : float
+        Size of the symbol, in points.
+    """
+    module_w = width / len(modules[0])
+    module_h = height / len(modules)
+    path = c.beginPath()
+    for row_index, row in enumerate(modules):
+        row_y = y + height - (row_index + 1) * module_h
+        col = 0
+        for bit, run in itertools.groupby(row):
+            run_length = sum(1 for _ in run)
+            if bit == "1":
+                path.rect(x + col * module_w, row_y, run_length * module_w, module_h)
+            col += run_length
+    c.drawPath(path, stroke=0, fill=1)
+
+
+def _open_template(raw: bytes) -> Tuple[pikepdf.Pdf, threading.Lock]:
+    """
+    Parse a background template PDF and pair it with the lock that guards it.
+
+    pikepdf objects are not safe to read from several threads at once, so every read
+    of a shared template must hold its lock.
+
+    Parameters
+    ----------
+    raw : bytes
+        Raw bytes of the template PDF.
+
+    Returns
+    -------
+    Tuple[pikepdf.Pdf, threading.Lock]
+        The parsed template, which must not be modified, and its lock.
+    """
+    import pikepdf
+
+    return pikepdf.Pdf.open(BytesIO(raw)), threading.Lock()
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _parse_template(template_hash: bytes, _raw: bytes) -> Tuple[pikepdf.Pdf, threading.Lock]:
+    """
+    Parse a background template PDF once per distinct upload.
+
+    The lock is cached together with the template, so every session and every script
+    rerun that shares the template also shares its lock.
+
+    Parameters
+    ----------
+    template_hash : bytes
+        BLAKE2b digest of the template bytes, used as the cache key.
+    _raw : bytes
+        Raw bytes of the template PDF. Excluded from Streamlit's argument hashing.
+
+    Returns
+    -------
+    Tuple[pikepdf.Pdf, threading.Lock]
+        The parsed template, shared between sessions, and the lock that guards it.
+    """
+    return _open_template(_raw)
+
+
+def template_digest(background_bytes: bytes) -> bytes:
+    """
+    Return the BLAKE2b fingerprint used to key caches on a background template.
+
+    Parameters
+    ----------
+    background_bytes : bytes
+        Raw bytes of the background PDF template.
+
+    Returns
+    -------
+    bytes
+        A 16-byte digest of the template.
+    """
+    return hashlib.blake2b(background_bytes, digest_size=16).digest()
+
+
+def build_label(
     sku: str,
     lot_code: str,
     mfg_date: date,
     coo_display: str,
     background_bytes: bytes,
-    gs1_data: str,
+    barcode_modules: Tuple[str, ...],
     cust_part: str,
     revision: str,
     cust_po: str,
     note: str,
     quantity: int,
+    template_hash: Optional[bytes] = None,
+    template: Optional[Tuple[pikepdf.Pdf, threading.Lock]] = None,
 ) -> bytes:
     """
     Render the final product label PDF by overlaying text and barcode onto the background template.
 
     Coordinates are specified in millimeters and converted to points for ReportLab.
-    The overlay PDF is merged with the background template PDF to produce the final output.
+    The overlay PDF is stamped onto the first page of the background template to produce
+    the final output. The barcode is passed in already encoded, so this function never
+    runs Ghostscript itself.
 
     Parameters
     ----------
@@ -226,8 +673,8 @@ def render_label(
         Country of origin display name.
     background_bytes : bytes
         Raw bytes of the background PDF template.
-    gs1_data : str
-        GS1 encoded data string for barcode.
+    barcode_modules : Tuple[str, ...]
+        DataMatrix module grid as returned by :func:`generate_barcode_modules`.
     cust_part : str
         Customer part number.
     revision : str
@@ -238,64 +685,242 @@ def render_label(
         Note text.
     quantity : int
         Quantity value.
+    template_hash : Optional[bytes]
+        Precomputed :func:`template_digest` of ``background_bytes``; computed here if omitted.
+    template : Optional[Tuple[pikepdf.Pdf, threading.Lock]]
+        Already parsed template and its lock, as returned by :func:`_open_template`. If
+        omitted, the template is parsed through Streamlit's resource cache.
 
     Returns
     -------
     bytes
         The rendered label as PDF bytes.
     """
-    buffer = BytesIO()
-    overlay_packet = BytesIO()
+    import pikepdf
 
     # Define label size in points (mm converted)
     page_width = 152.5 * mm
     page_height = 101.6 * mm
 
-    # Create a canvas for the overlay layer
-    c = canvas.Canvas(overlay_packet, pagesize=(page_width, page_height))
+    # Create a canvas for the overlay layer; its bytes are taken directly with
+    # getpdfdata() rather than streamed through an intermediate file object. The overlay
+    # is left uncompressed because pikepdf compresses it once when writing the label, and
+    # invariant mode skips the timestamp and random document ID the overlay never needs.
+    c = canvas.Canvas(None, pagesize=(page_width, page_height), pageCompression=0, invariant=1)
 
     # Draw fixed text fields on the label at specified positions
     start_x = 5 * mm
     start_y = 73 * mm
     step_y = 5.75 * mm
     font_size = 14
-    c.setFont("Helvetica", font_size)
-    c.drawString(start_x, start_y, f"PART #: {cust_part}")
-    c.drawString(start_x, start_y - step_y, f"REV #: {revision}")
-    c.drawString(start_x, start_y - 2 * step_y, f"PO#: {cust_po}")
-    c.drawString(start_x, start_y - 3 * step_y, f"NOTE: {note[:40]}")
-    c.drawString(start_x, start_y - 4 * step_y, f"QUANTITY: {quantity}")
-    c.drawString(start_x, start_y - 5 * step_y, f"RESIN SKU: {sku}")
-    c.drawString(start_x, start_y - 6 * step_y, f"RESIN LOT #: {lot_code}")
-    c.drawString(start_x, start_y - 7 * step_y, f"MFG. DATE: {mfg_date:%Y-%m-%d}")
-    c.drawString(start_x, start_y - 8 * step_y, f"COO: {coo_display}")
-
-    # Generate the DataMatrix barcode image and embed it
-    barcode_img = generate_barcode_image(gs1_data)
-    barcode_reader = ImageReader(barcode_img)
-    # Position barcode at bottom-left corner with size 25mm x 25mm
-    c.drawImage(
-        barcode_reader,
+    # All lines go into a single PDF text object, one line per step_y of leading
+    text = c.beginText(start_x, start_y)
+    text.setFont("Helvetica", font_size, leading=step_y)
+    text.textLine(f"PART #: {cust_part}")
+    text.textLine(f"REV #: {revision}")
+    text.textLine(f"PO#: {cust_po}")
+    text.textLine(f"NOTE: {note[:40]}")
+    text.textLine(f"QUANTITY: {quantity}")
+    text.textLine(f"RESIN SKU: {sku}")
+    text.textLine(f"RESIN LOT #: {lot_code}")
+    text.textLine(f"MFG. DATE: {mfg_date:%Y-%m-%d}")
+    text.textLine(f"COO: {coo_display}")
+    c.drawText(text)
+
+    # Draw the DataMatrix barcode as vector shapes
+    # Position barcode at bottom-right corner with size 25mm x 25mm
+    draw_barcode(
+        c,
+        barcode_modules,
         x=121.5 * mm,
         y=5.7 * mm,
         width=25 * mm,
         height=25 * mm,
     )
-    c.save()
-
-    # Merge the overlay PDF with the background template PDF
-    overlay_packet.seek(0)
-    overlay_pdf = PdfReader(overlay_packet)
-    base_pdf = PdfReader(BytesIO(background_bytes))
-    output = PdfWriter()
-    page = base_pdf.pages[0]
-    page.merge_page(overlay_pdf.pages[0])
-    output.add_page(page)
-    output.write(buffer)
+    overlay_bytes = c.getpdfdata()
+
+    # Stamp the overlay onto the background page as a form XObject; the template's
+    # own content stream is referenced rather than decoded and re-encoded
+    overlay_pdf = pikepdf.Pdf.open(BytesIO(overlay_bytes))
+    if template is None:
+        if template_hash is None:
+            template_hash = template_digest(background_bytes)
+        template = _parse_template(template_hash, background_bytes)
+    template_pdf, template_lock = template
+    # Copy the template page into a fresh document so the cached template is never mutated
+    output = pikepdf.new()
+    with template_lock:
+        output.pages.append(template_pdf.pages[0])
+    output.pages[0].add_overlay(overlay_pdf.pages[0])
+    buffer = BytesIO()
+    # Flate streams from the template are copied through as-is; only the uncompressed
+    # overlay stream is compressed
+    output.save(buffer, linearize=False, compress_streams=True)
 
     return buffer.getvalue()
 
 
+@st.cache_data(show_spinner=False)
+def render_label(
+    template_hash: bytes,
+    _background_bytes: bytes,
+    sku: str,
+    lot_code: str,
+    mfg_date: date,
+    coo_display: str,
+    gs1_data: str,
+    cust_part: str,
+    revision: str,
+    cust_po: str,
+    note: str,
+    quantity: int,
+) -> bytes:
+    """
+    Render a label through Streamlit's data cache; used by the app.
+
+    The cache is keyed on ``template_hash`` and the label fields. The template bytes are
+    excluded from Streamlit's argument hashing, which would otherwise hash the whole
+    template on every call. The barcode comes from :func:`generate_barcode_modules`, a
+    separate cache keyed only by ``gs1_data``, so a cache miss caused by a text-only
+    edit redraws the overlay without running Ghostscript again.
+
+    Parameters
+    ----------
+    template_hash : bytes
+        :func:`template_digest` of the template.
+    _background_bytes : bytes
+        Raw bytes of the background PDF template.
+    sku : str
+        Resin SKU.
+    lot_code : str
+        Sanitized lot code.
+    mfg_date : date
+        Manufacturing date.
+    coo_display : str
+        Country of origin display name.
+    gs1_data : str
+        GS1 encoded data string for barcode.
+    cust_part : str
+        Customer part number.
+    revision : str
+        Revision number.
+    cust_po : str
+        Customer PO number.
+    note : str
+        Note text.
+    quantity : int
+        Quantity value.
+
+    Returns
+    -------
+    bytes
+        The rendered label as PDF bytes.
+    """
+    return build_label(
+        sku=sku,
+        lot_code=lot_code,
+        mfg_date=mfg_date,
+        coo_display=coo_display,
+        background_bytes=_background_bytes,
+        barcode_modules=generate_barcode_modules(gs1_data),
+        cust_part=cust_part,
+        revision=revision,
+        cust_po=cust_po,
+        note=note,
+        quantity=quantity,
+        template_hash=template_hash,
+    )
+
+
+# Template and Ghostscript interpreter for batch worker processes, set once per worker
+# by _init_batch_worker. Workers do not use Streamlit's caches, which belong to the
+# app's server process.
+_BATCH_BACKGROUND: Optional[bytes] = None
+_BATCH_TEMPLATE: Optional[Tuple[pikepdf.Pdf, threading.Lock]] = None
+_BATCH_SESSION: Optional[_GhostscriptSession] = None
+
+
+def _init_batch_worker(background_bytes: bytes) -> None:
+    """
+    Prepare a batch worker process to render labels on the given template.
+    """
+    global _BATCH_BACKGROUND, _BATCH_TEMPLATE, _BATCH_SESSION
+    _BATCH_BACKGROUND = background_bytes
+    _BATCH_TEMPLATE = _open_template(background_bytes)
+    _BATCH_SESSION = _GhostscriptSession()
+
+
+def _render_batch_job(job: Dict[str, Any]) -> bytes:
+    """
+    Render one batch label in a worker process.
+    """
+    fields = dict(job)
+    barcode_modules = _encode_barcode(fields.pop("gs1_data"), _BATCH_SESSION)
+    return build_label(
+        background_bytes=_BATCH_BACKGROUND,
+        template=_BATCH_TEMPLATE,
+        barcode_modules=barcode_modules,
+        **fields,
+    )
+
+
+def render_labels_batch(
+    background_bytes: bytes,
+    jobs: Sequence[Dict[str, Any]],
+    max_workers: Optional[int] = None,
+) -> List[bytes]:
+    """
+    Render several labels on the same template in parallel worker processes.
+
+    The template bytes are sent to each worker once, when it starts, rather than with
+    every job. Each worker parses the template once and encodes barcodes with its own
+    Ghostscript interpreter, without going through Streamlit's caches.
+
+    Parameters
+    ----------
+    background_bytes : bytes
+        Raw bytes of the background PDF template shared by all labels.
+    jobs : Sequence[Dict[str, Any]]
+        Label fields for each label, as keyword arguments of :func:`render_label`
+        without ``template_hash`` and ``_background_bytes``.
+    max_workers : Optional[int]
+        Number of worker processes; defaults to the number of CPUs.
+
+    Returns
+    -------
+    List[bytes]
+        The rendered labels as PDF bytes, in the same order as ``jobs``.
+    """
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_batch_worker,
+        initargs=(background_bytes,),
+    ) as executor:
+        return list(executor.map(_render_batch_job, jobs))
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _read_template_file(path: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read a template file from disk, cached until its modification time or size changes.
+
+    Parameters
+    ----------
+    path : str
+        Path of the template PDF.
+    mtime_ns : int
+        Modification time of the file in nanoseconds; part of the cache key only.
+    size : int
+        Size of the file in bytes; part of the cache key only.
+
+    Returns
+    -------
+    bytes
+        The raw bytes of the template PDF.
+    """
+    return Path(path).read_bytes()
+
+
 def load_template(default_name: str = "Elect Nano 2025 Label Template V1.pdf") -> Optional[bytes]:
     """
     Load the PDF template from an uploaded file or fallback to a local bundled file.
@@ -316,12 +941,12 @@ def load_template(default_name: str = "Elect Nano 2025 Label Template V1.pdf") -
     uploaded = st.session_state.get("_uploaded_template")
     if uploaded is not None:
         return uploaded.getvalue()
-    # Use the directory containing this script for fallback template
-    script_dir = Path(__file__).resolve().parent
-    candidate = script_dir / default_name
-    if candidate.exists():
-        return candidate.read_bytes()
-    return None
+    candidate = SCRIPT_DIR / default_name
+    try:
+        stat = candidate.stat()
+    except FileNotFoundError:
+        return None
+    return _read_template_file(str(candidate), stat.st_mtime_ns, stat.st_size)
 
 
 def main() -> None:
@@ -346,13 +971,6 @@ def main() -> None:
             st.session_state["_uploaded_template"] = uploaded_file
             st.success("Custom template uploaded successfully.")
 
-    # Map country names to GS1 numeric codes
-    country_options = {
-        "United States": "840",
-        "Japan": "392",
-        "China": "156",
-    }
-
     # Form for label input parameters
     with st.form("label_form"):
         sku = st.text_input("Resin SKU", value="X-MC-CO-EMI-000-01")
@@ -369,8 +987,8 @@ def main() -> None:
 
         mfg_date = st.date_input("Manufacturing Date", value=date.today())
         quantity = st.number_input("Quantity", min_value=1, value=1)
-        coo_display = st.selectbox("Country of Origin", options=list(country_options.keys()), index=0)
-        coo_code = country_options[coo_display]
+        coo_display = st.selectbox("Country of Origin", options=list(COUNTRY_OPTIONS), index=0)
+        coo_code = COUNTRY_OPTIONS[coo_display]
 
         cust_po_raw = st.text_input("Customer PO Number", value="123456789")
         cust_po = sanitize_gs1_text(cust_po_raw)
@@ -426,11 +1044,12 @@ def main() -> None:
 
         # Render the label PDF with overlay and barcode
         pdf_bytes = render_label(
+            template_hash=template_digest(bg_bytes),
+            _background_bytes=bg_bytes,
             sku=sku,
             lot_code=lot_num,
             mfg_date=mfg_date,
             coo_display=coo_display,
-            background_bytes=bg_bytes,
             gs1_data=gs1_data,
             cust_part=cust_part,
             revision=revision,
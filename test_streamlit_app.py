@@ -0,0 +1,85 @@
+import shutil
+from datetime import date
+from io import BytesIO
+
+import pytest
+
+import streamlit_app
+
+requires_ghostscript = pytest.mark.skipif(
+    shutil.which("gs") is None, reason="Ghostscript executable 'gs' not found."
+)
+
+
+@requires_ghostscript
+@pytest.mark.parametrize(
+    "gs1_data",
+    [
+        "(01)00000000000000(10)ENAB12(11)250101(240)ENB-001",
+        "(01)00000000000000(10)ENAB12(11)250101(240)ENB-001(241)CP-77(422)840",
+    ],
+)
+def test_ghostscript_session_matches_treepoem(gs1_data):
+    session = streamlit_app._GhostscriptSession()
+    try:
+        modules = session.encode("gs1datamatrix", gs1_data, "parsefnc")
+        # A second job on the same interpreter must not see state left by the first
+        assert session.encode("gs1datamatrix", gs1_data, "parsefnc") == modules
+    finally:
+        session.close()
+    image = streamlit_app._treepoem().generate_barcode(
+        barcode_type="gs1datamatrix",
+        data=gs1_data,
+        options={"parsefnc": True},
+    )
+    assert modules == streamlit_app._image_to_modules(image)
+
+
+@requires_ghostscript
+def test_ghostscript_session_reports_bwipp_errors():
+    session = streamlit_app._GhostscriptSession()
+    try:
+        with pytest.raises(RuntimeError):
+            session.encode("gs1datamatrix", "not a GS1 string", "parsefnc")
+        # The interpreter must still answer after BWIPP raised an error
+        assert streamlit_app._has_finder_pattern(
+            session.encode("gs1datamatrix", "(01)00000000000000", "parsefnc")
+        )
+    finally:
+        session.close()
+
+
+@requires_ghostscript
+def test_render_labels_batch_keeps_job_order():
+    import pikepdf
+
+    background = streamlit_app.SCRIPT_DIR.joinpath(
+        "Elect Nano 2025 Label Template V1.pdf"
+    ).read_bytes()
+    jobs = [
+        {
+            "sku": "X-MC-CO-EMI-000-01",
+            "lot_code": f"EN-2501-{i:02d}",
+            "mfg_date": date(2025, 1, 2),
+            "coo_display": "Japan",
+            "gs1_data": f"(01)00000000000000(10)EN-2501-{i:02d}",
+            "cust_part": f"PART-{i}",
+            "revision": "01",
+            "cust_po": "PO-1",
+            "note": "",
+            "quantity": i + 1,
+        }
+        for i in range(4)
+    ]
+    labels = streamlit_app.render_labels_batch(background, jobs, max_workers=2)
+
+    assert len(labels) == len(jobs)
+    for i, label in enumerate(labels):
+        with pikepdf.Pdf.open(BytesIO(label)) as pdf:
+            assert len(pdf.pages) == 1
+            overlay = b"".join(
+                xobject.read_bytes()
+                for xobject in pdf.pages[0].Resources.XObject.values()
+                if xobject.Subtype == "/Form"
+            )
+        assert f"PART #: PART-{i}".encode() in overlay